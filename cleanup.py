@@ -7,59 +7,118 @@ Removes generated result files, cache directories, and temporary files.
 
 import os
 import shutil
-import glob
+
+# Name rules for generated files, matched in a single directory pass
+RESULT_PREFIX = 'donation_opportunities_'
+RESULT_SUFFIXES = ('.json', '.csv')
+TEMP_SUFFIXES = ('.tmp', '.temp', '.pyc')
+
+# Whether removals can be resolved relative to open directory fds
+DIR_FD_SUPPORTED = os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd
+
+
+def _match_pattern(name, prefix, suffixes):
+    """Match '<prefix>*<suffix>' names, rejecting on the literal prefix first"""
+    if not name.startswith(prefix):
+        return False
+    return name.endswith(suffixes)
+
+
+def _remove_files(names, directory='.'):
+    """Remove files via unlinkat on one directory fd instead of full-path lookups"""
+    dir_fd = None
+    if DIR_FD_SUPPORTED:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    
+    try:
+        for name in names:
+            display = name if directory == '.' else os.path.join(directory, name)
+            try:
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    os.remove(display)
+                print(f"   Removed: {display}")
+            except OSError as e:
+                print(f"   Error removing {display}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def _rmtree_at(parent_fd, name):
+    """Recursively remove directory ``name`` using unlinkat/rmdirat relative to ``parent_fd``"""
+    dir_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=parent_fd)
+    try:
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _rmtree_at(dir_fd, entry.name)
+                else:
+                    os.unlink(entry.name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+    os.rmdir(name, dir_fd=parent_fd)
+
+
+def _remove_tree(path):
+    """Remove a directory tree, walking it by fd where supported"""
+    if not DIR_FD_SUPPORTED:
+        shutil.rmtree(path)
+        return
+    
+    cwd_fd = os.open('.', os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        _rmtree_at(cwd_fd, path)
+    finally:
+        os.close(cwd_fd)
+
 
 def cleanup_files():
     """Remove generated files and caches"""
     
     print("🧹 Cleaning up generated files...")
     
-    # Remove generated result files
-    result_patterns = [
-        'donation_opportunities_*.json',
-        'donation_opportunities_*.csv'
-    ]
+    # Classify generated result files and temporary files in one scan,
+    # keeping a snapshot of names to answer existence checks below
+    result_files = []
+    temp_files = []
+    names = set()
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            names.add(name)
+            if name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                continue
+            if _match_pattern(name, RESULT_PREFIX, RESULT_SUFFIXES):
+                result_files.append(name)
+            elif name.endswith(TEMP_SUFFIXES):
+                temp_files.append(name)
     
-    for pattern in result_patterns:
-        files = glob.glob(pattern)
-        for file in files:
-            try:
-                os.remove(file)
-                print(f"   Removed: {file}")
-            except OSError as e:
-                print(f"   Error removing {file}: {e}")
+    # Remove generated result files
+    _remove_files(result_files)
     
     # Clean up results directory
-    if os.path.exists('results'):
+    if 'results' in names:
         try:
-            for file in os.listdir('results'):
-                file_path = os.path.join('results', file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    print(f"   Removed: {file_path}")
+            with os.scandir('results') as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
+            _remove_files(files, 'results')
         except OSError as e:
             print(f"   Error cleaning results directory: {e}")
     
     # Remove Python cache directories
     cache_dirs = ['__pycache__', '.pytest_cache']
     for cache_dir in cache_dirs:
-        if os.path.exists(cache_dir):
+        if cache_dir in names:
             try:
-                shutil.rmtree(cache_dir)
+                _remove_tree(cache_dir)
                 print(f"   Removed: {cache_dir}/")
             except OSError as e:
                 print(f"   Error removing {cache_dir}: {e}")
     
     # Remove temporary files
-    temp_patterns = ['*.tmp', '*.temp', '*.pyc']
-    for pattern in temp_patterns:
-        files = glob.glob(pattern, recursive=True)
-        for file in files:
-            try:
-                os.remove(file)
-                print(f"   Removed: {file}")
-            except OSError as e:
-                print(f"   Error removing {file}: {e}")
+    _remove_files(temp_files)
     
     print("✅ Cleanup completed!")
     
@@ -75,7 +134,7 @@ def cleanup_files():
     ]
     
     for file in preserved:
-        if os.path.exists(file):
+        if file in names:
             print(f"   ✅ {file}")
         else:
             print(f"   ❌ {file} (not found)")
@@ -9,17 +9,41 @@ using zip codes or coordinates.
 import argparse
 import sys
 import json
+import logging
 import os
-from donation_finder import DonationFinderNew
-from zip_finder import SimpleZipCodeFinder
-from email_sender import EmailSender
+from concurrent.futures import Future
+from operator import itemgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ensure_ascii=False writes non-ASCII text as UTF-8, like orjson does
+_indented_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _json_dumps_indented(obj):
+    """Serialize to 2-space indented JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return _indented_encoder.encode(obj).encode('utf-8')
 
 
 def load_config():
     """Load configuration from config.json"""
     try:
-        with open('config.json', 'r') as f:
-            return json.load(f)
+        with open('config.json', 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError:
@@ -29,14 +53,17 @@ def load_config():
 
 def get_api_key():
     """Get API key from environment, .env file, or .env.example"""
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-    
     api_key = os.getenv('GOOGLE_PLACES_API_KEY') or os.getenv('GOOGLE_MAPS_API_KEY')
     
+    # Only load .env when the environment doesn't already provide a key
+    if not api_key:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+        api_key = os.getenv('GOOGLE_PLACES_API_KEY') or os.getenv('GOOGLE_MAPS_API_KEY')
+    
     # If not found, try to read from .env.example
     if not api_key:
         try:
@@ -66,8 +93,15 @@ def save_results(places, filename_base, format='both'):
     
     if format in ['json', 'both']:
         json_file = f"{filename_base}.json"
-        with open(json_file, 'w') as f:
-            json.dump(places, f, indent=2)
+        # Encode one place at a time so only a single record is buffered;
+        # the layout matches json.dump(places, f, indent=2)
+        with open(json_file, 'wb') as f:
+            f.write(b"[\n  ")
+            for i, place in enumerate(places):
+                if i:
+                    f.write(b",\n  ")
+                f.write(_json_dumps_indented(place).replace(b"\n", b"\n  "))
+            f.write(b"\n]")
         print(f"Results saved to {json_file}")
         saved_files.append(json_file)
     
@@ -75,31 +109,43 @@ def save_results(places, filename_base, format='both'):
         import csv
         csv_file = f"{filename_base}.csv"
         
-        # Get all possible fieldnames
-        fieldnames = set()
-        for place in places:
-            fieldnames.update(place.keys())
-        fieldnames = sorted(fieldnames)
+        # Places from one search normally share a schema, so take the first
+        # place's keys and only fall back to a full union when rows differ
+        fieldnames = list(places[0])
+        first_keys = places[0].keys()
+        if len(fieldnames) > 1 and all(place.keys() == first_keys for place in places):
+            rows = map(itemgetter(*fieldnames), places)
+        else:
+            fieldnames = list(dict.fromkeys(key for place in places for key in place))
+            rows = ([place.get(key, '') for key in fieldnames] for place in places)
         
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(places)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
         print(f"Results saved to {csv_file}")
         saved_files.append(csv_file)
     
     return saved_files
 
 
-def send_email_results(places, search_info, attach_files=None):
-    """Send results via email if configured"""
+def send_email_results(places, search_info, attach_files=None, background=False):
+    """
+    Send results via email if configured
+    
+    With background=True the send runs on a worker thread and a Future for
+    its result is returned instead; the caller collects it with .result().
+    """
     try:
+        from email_sender import EmailSender
         email_sender = EmailSender()
         
         if not email_sender.is_configured():
             print("📧 Email not configured - skipping email delivery")
             return False
         
+        if background:
+            return email_sender.send_results_email_async(places, search_info, attach_files)
         return email_sender.send_results_email(places, search_info, attach_files)
     
     except Exception as e:
@@ -113,50 +159,60 @@ def print_results(places, quiet=False, show_reviews=False):
         print("No donation opportunities found.")
         return
     
-    print(f"\nFound {len(places)} donation opportunities:")
-    print("-" * 80)
+    # Collect all output lines and write them in one call
+    lines = [f"\nFound {len(places)} donation opportunities:", "-" * 80]
+    append = lines.append
     
     for i, place in enumerate(places, 1):
+        name = place['name']
+        rating = place.get('rating')
+        total_reviews = place.get('user_ratings_total') or 0
+        
         if quiet:
             # Compact format
             distance = f" ({place['distance_km']:.1f}km)" if 'distance_km' in place else ""
-            rating = f" ⭐{place['rating']}" if place.get('rating') else ""
-            review_count = f" ({place.get('user_ratings_total', 0)} reviews)" if place.get('user_ratings_total') else ""
-            print(f"{i}. {place['name']}{distance}{rating}{review_count}")
+            rating_text = f" ⭐{rating}" if rating else ""
+            review_count = f" ({total_reviews} reviews)" if total_reviews else ""
+            append(f"{i}. {name}{distance}{rating_text}{review_count}")
         else:
             # Detailed format
-            print(f"{i}. {place['name']}")
+            append(f"{i}. {name}")
             if 'formatted_address' in place:
-                print(f"   📍 {place['formatted_address']}")
-            if 'rating' in place and place['rating'] is not None:
-                total_reviews = place.get('user_ratings_total', 0)
+                append(f"   📍 {place['formatted_address']}")
+            if rating is not None:
                 review_text = f" ({total_reviews} reviews)" if total_reviews > 0 else ""
-                print(f"   ⭐ Rating: {place['rating']}/5{review_text}")
+                append(f"   ⭐ Rating: {rating}/5{review_text}")
             if 'distance_km' in place:
-                print(f"   📏 Distance: {place['distance_km']:.1f} km")
+                append(f"   📏 Distance: {place['distance_km']:.1f} km")
             if place.get('phone'):
-                print(f"   📞 Phone: {place['phone']}")
+                append(f"   📞 Phone: {place['phone']}")
             if place.get('website'):
-                print(f"   🌐 Website: {place['website']}")
+                append(f"   🌐 Website: {place['website']}")
             if place.get('email'):
-                print(f"   📧 Email: {place['email']}")
+                append(f"   📧 Email: {place['email']}")
             if place.get('opening_hours'):
-                print(f"   🕒 Hours: {place['opening_hours'][0]}")
+                append(f"   🕒 Hours: {place['opening_hours'][0]}")
             if 'types' in place:
-                print(f"   🏷️  Categories: {', '.join(place['types'][:3])}")
+                append(f"   🏷️  Categories: {', '.join(place['types'][:3])}")
             
             # Show reviews if available and requested
-            if show_reviews and place.get('reviews'):
-                print(f"   📝 Reviews ({len(place['reviews'])}):")
-                for review in place['reviews']:
-                    author = review.get('author_name', 'Anonymous')
-                    rating = "⭐" * review.get('rating', 0)
-                    time_desc = review.get('time_description', '')
-                    text = review.get('text', '')[:200] + "..." if len(review.get('text', '')) > 200 else review.get('text', '')
-                    print(f"      • {author} {rating} {time_desc}")
+            reviews = place.get('reviews')
+            if show_reviews and reviews:
+                append(f"   📝 Reviews ({len(reviews)}):")
+                for review in reviews:
+                    get = review.get
+                    author = get('author_name', 'Anonymous')
+                    stars = "⭐" * get('rating', 0)
+                    time_desc = get('time_description', '')
+                    text = get('text', '')
+                    if len(text) > 200:
+                        text = text[:200] + "..."
+                    append(f"      • {author} {stars} {time_desc}")
                     if text.strip():
-                        print(f"        \"{text}\"")
-            print()
+                        append(f"        \"{text}\"")
+            append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -200,9 +256,24 @@ def main():
                        help='Send results via email to configured recipient')
     parser.add_argument('--quiet', action='store_true',
                        help='Quiet mode - compact output')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show per-place progress and API call details')
     
     args = parser.parse_args()
     
+    # Search progress is logged by donation_finder; quiet mode keeps only
+    # warnings and errors, verbose mode adds its per-place detail. Only that
+    # logger prints to stdout, so other libraries' logging is unaffected.
+    finder_log = logging.getLogger('donation_finder')
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    finder_log.addHandler(handler)
+    finder_log.propagate = False
+    if args.verbose:
+        finder_log.setLevel(logging.DEBUG)
+    else:
+        finder_log.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    
     # Validate coordinate search
     if args.lat is not None and args.lng is None:
         parser.error("--lng is required when using --lat")
@@ -218,6 +289,9 @@ def main():
     try:
         if args.zip:
             # Single ZIP code search
+            from donation_finder import DonationFinderNew
+            from zip_finder import SimpleZipCodeFinder
+            
             print(f"🔍 Searching for donation opportunities in ZIP code: {args.zip}")
             print(f"🔑 Keywords: {', '.join(keywords)}")
             print(f"📏 Radius: {args.radius}m")
@@ -262,6 +336,9 @@ def main():
             
         elif args.zip_batch:
             # Multiple ZIP codes from config
+            from donation_finder import DonationFinderNew
+            from zip_finder import SimpleZipCodeFinder
+            
             config = load_config()
             zip_codes = config.get('zip_codes', {}).get('enabled_zip_codes', [])
             
@@ -278,10 +355,18 @@ def main():
                 zip_codes, keywords, args.max_results//len(zip_codes), args.radius
             )
             
-            # Combine all results
+            # Combine all results; neighboring ZIP codes (and ZIP codes that
+            # shared a search) return the same places, so keep each place once
             all_places = []
+            seen_place_ids = set()
             for zip_code, places in all_results.items():
-                all_places.extend(places)
+                for place in places:
+                    place_id = place.get('place_id')
+                    if place_id:
+                        if place_id in seen_place_ids:
+                            continue
+                        seen_place_ids.add(place_id)
+                    all_places.append(place)
             
             if all_places:
                 donation_finder = DonationFinderNew(api_key)
@@ -304,27 +389,34 @@ def main():
                 if args.email or args.include_reviews:
                     print(f"\n📊 API Usage Summary: {donation_finder.total_api_calls} total Google Places API calls made")
             
+            email_result = None
             if all_places:
                 print(f"\n🎯 Combined results from all ZIP codes:")
                 print_results(all_places, args.quiet, args.include_reviews)
                 saved_files = save_results(all_places, f"{args.output}_batch", args.format)
                 
-                # Send email if requested
+                # Send email if requested; it goes out in the background
+                # while the per-ZIP files below are written
                 if args.email:
                     search_info = {
                         'type': 'Batch ZIP Code Search',
                         'location': f'{len(zip_codes)} ZIP codes: {", ".join(zip_codes)}',
                         'keywords': ', '.join(keywords)
                     }
-                    send_email_results(all_places, search_info, saved_files)
+                    email_result = send_email_results(all_places, search_info, saved_files, background=True)
             
             # Save individual results too (without reviews enhancement for individual files)
             for zip_code, places in all_results.items():
                 if places:
                     save_results(places, f"{args.output}_{zip_code}", args.format)
+            
+            if isinstance(email_result, Future):
+                email_result.result()
                     
         else:
             # Coordinate search
+            from donation_finder import DonationFinderNew
+            
             print(f"🔍 Searching for donation opportunities at coordinates: {args.lat}, {args.lng}")
             print(f"🔑 Keywords: {', '.join(keywords)}")
             print(f"📏 Radius: {args.radius}m")
@@ -332,19 +424,14 @@ def main():
             
             finder = DonationFinderNew(api_key)
             
-            all_places = []
-            for keyword in keywords:
-                enhanced_keyword = f"{keyword} near me"
-                print(f"Searching: '{enhanced_keyword}'")
-                places = finder.search_places(
-                    args.lat, args.lng, args.radius, enhanced_keyword, min_rating=0.0
-                )
-                if places:
-                    all_places.extend(places)
+            enhanced_keywords = [f"{keyword} near me" for keyword in keywords]
+            all_places = finder.search_keywords(
+                args.lat, args.lng, args.radius, enhanced_keywords, min_rating=0.0,
+                max_pages=finder.pages_for_results(args.max_results)
+            )
             
             if all_places:
-                unique_places = finder.deduplicate_places(all_places)
-                processed_places = finder.process_places(unique_places, args.lat, args.lng)
+                processed_places = finder.process_places(all_places, args.lat, args.lng)
                 final_places = processed_places[:args.max_results]
                 
                 # Extract emails if email flag is used
@@ -6,12 +6,246 @@ This version uses the new Google Places API which is the recommended approach.
 """
 
 import os
+import gzip
 import json
+import logging
 import time
 import math
 import re
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+log = logging.getLogger('donation_finder')
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indented(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _place_id(place: Dict[str, Any]) -> Optional[str]:
+    """Return the place id of a raw or processed place"""
+    return place.get('id') or place.get('place_id')
+
+
+# Radius of earth in meters
+EARTH_RADIUS_METERS = 6371000
+
+
+def haversine_distances(origin_lat: float, origin_lng: float, points: List[Tuple[float, float]]) -> List[float]:
+    """
+    Calculate distances from one origin to many points using the Haversine formula
+    
+    Origin terms are converted and evaluated once for the whole batch.
+    
+    Args:
+        origin_lat, origin_lng: Origin coordinates in degrees
+        points: (latitude, longitude) pairs in degrees
+        
+    Returns:
+        Distances in meters, in the same order as points
+    """
+    # Bind the math functions locally and fold the degree conversion and the
+    # half-angle into one multiplier, keeping attribute lookups and divisions
+    # out of the per-point loop
+    sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+    to_rad = math.pi / 180
+    half_to_rad = to_rad / 2
+    diameter = 2 * EARTH_RADIUS_METERS
+    
+    cos_lat0 = cos(origin_lat * to_rad)
+    
+    distances = []
+    append = distances.append
+    for lat, lng in points:
+        sin_dlat = sin((lat - origin_lat) * half_to_rad)
+        sin_dlng = sin((lng - origin_lng) * half_to_rad)
+        a = sin_dlat * sin_dlat + cos_lat0 * cos(lat * to_rad) * sin_dlng * sin_dlng
+        append(diameter * asin(sqrt(a)))
+    return distances
+
+
+def equirectangular_distances(origin_lat: float, origin_lng: float, points: List[Tuple[float, float]]) -> List[float]:
+    """
+    Approximate distances from one origin to many points on a flat local map
+    
+    Treats the area around the origin as a plane scaled by cos(latitude).
+    Within ~10 km this stays within 0.1% of the Haversine distance while
+    using no per-point trig, so it suits radius checks on nearby results.
+    
+    Args:
+        origin_lat, origin_lng: Origin coordinates in degrees
+        points: (latitude, longitude) pairs in degrees
+        
+    Returns:
+        Approximate distances in meters, in the same order as points
+    """
+    hypot = math.hypot
+    meters_per_degree = EARTH_RADIUS_METERS * math.pi / 180
+    cos_lat0 = math.cos(math.radians(origin_lat))
+    return [
+        meters_per_degree * hypot((lng - origin_lng) * cos_lat0, lat - origin_lat)
+        for lat, lng in points
+    ]
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows short bursts while holding a sustained rate"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum tokens held, i.e. the largest burst allowed
+            refill_rate: Tokens added per second (the sustained rate)
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping until enough are available
+        
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return waited
+                wait = (cost - self.tokens) / self.refill_rate
+            time.sleep(wait)
+            waited += wait
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry that coalesces concurrent misses"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}  # key -> Future for a computation in progress
+        self._lock = threading.Lock()
+    
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, calling compute() on a miss
+        
+        Concurrent misses for the same key wait on the first caller's
+        result instead of computing it again. Exceptions are not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+
+@dataclass
+class RawPlace:
+    """Fields of one Text Search result, read from the API dict once"""
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        'id', 'name', 'address', 'latitude', 'longitude', 'rating',
+        'business_status', 'types', 'price_level', 'user_ratings_total'
+    )
+    
+    id: str
+    name: str
+    address: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+    rating: Optional[float]
+    business_status: str
+    types: List[str]
+    price_level: Optional[str]
+    user_ratings_total: Optional[int]
+    
+    @classmethod
+    def from_api(cls, place: Dict[str, Any]) -> 'RawPlace':
+        """Parse a place dict from the Places API (New)"""
+        get = place.get
+        location = get('location') or {}
+        return cls(
+            id=get('id', ''),
+            name=(get('displayName') or {}).get('text', 'Unknown'),
+            address=get('formattedAddress', 'No address available'),
+            latitude=location.get('latitude'),
+            longitude=location.get('longitude'),
+            rating=get('rating'),
+            business_status=get('businessStatus', ''),
+            types=get('types', []),
+            price_level=get('priceLevel'),
+            user_ratings_total=get('userRatingCount')
+        )
+    
+    @property
+    def located(self) -> bool:
+        """True when both coordinates are present (and non-zero)"""
+        return bool(self.latitude and self.longitude)
 
 
 class DonationFinderNew:
@@ -25,17 +259,56 @@ class DonationFinderNew:
     SEARCH_API_DELAY = 1.2  # Seconds between search API calls
     DETAILS_API_DELAY = 0.8  # Seconds between place details API calls  
     EMAIL_SCRAPE_DELAY = 0.6  # Seconds between website email scraping
+    RATE_LIMIT_BURST = 5  # Calls of each type allowed back-to-back before delays apply
+    
+    # Only the start of a page is scanned for emails; contact links sit in
+    # headers/footers, and this avoids downloading multi-MB pages whole
+    MAX_SCRAPE_BYTES = 256 * 1024
+    
+    # Email patterns for website scraping, matched against raw page bytes
+    _MAILTO_RE = re.compile(rb'mailto:([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})', re.IGNORECASE)
+    _EMAIL_RE = re.compile(rb'\b[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}\b', re.IGNORECASE)
+    # Common non-contact addresses, checked with one alternation scan
+    _EXCLUDED_EMAIL_RE = re.compile(rb'noreply@|no-reply@|donotreply@|support@google|webmaster@|admin@|postmaster@', re.IGNORECASE)
+    
+    # Website hosts that never expose an organization's contact email in
+    # their HTML (social networks, video sites, map links); not scraped
+    _UNSCRAPABLE_DOMAINS = frozenset({
+        'facebook.com', 'fb.com', 'instagram.com', 'youtube.com', 'youtu.be',
+        'twitter.com', 'x.com', 't.me', 'linkedin.com', 'tiktok.com',
+        'maps.google.com', 'maps.app.goo.gl', 'g.page'
+    })
+    
+    # Response caches, shared by all finder instances in the process. Hits
+    # skip both the network round trip and the rate limiter.
+    _search_cache = TTLCache(maxsize=1024, ttl=24 * 3600)  # 24 hours
+    _details_cache = TTLCache(maxsize=4096, ttl=7 * 24 * 3600)  # 7 days
+    
+    # Maximum number of API requests kept in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Number of website hosts whose scrape connections are kept open
+    SCRAPE_POOL_HOSTS = 20
     
-    # Default keywords for finding donation opportunities
+    # Largest search radius (meters) whose results are filtered with the
+    # equirectangular approximation instead of the Haversine formula
+    APPROXIMATE_RADIUS_LIMIT = 10000
+    
+    # Text Search returns up to 20 places per page and at most 3 pages
+    SEARCH_PAGE_SIZE = 20
+    MAX_SEARCH_PAGES = 3
+    
+    # Default keywords for finding donation opportunities. Each keyword is
+    # a separate search, so near-synonyms ("NGO" vs "nonprofit organization",
+    # "homeless shelter" vs "shelter") are left out: they return the same
+    # places and only spend extra requests
     DEFAULT_KEYWORDS = [
         "charity near me",
-        "NGO near me", 
         "food bank near me",
         "shelter near me",
         "orphanage near me",
         "donation center near me",
         "blood bank near me",
-        "homeless shelter near me",
         "soup kitchen near me",
         "community center near me",
         "nonprofit organization near me",
@@ -55,17 +328,42 @@ class DonationFinderNew:
         if not self.api_key:
             raise ValueError("Google Maps API key is required. Set GOOGLE_MAPS_API_KEY environment variable or pass api_key parameter.")
         
-        # Rate limiting tracking
-        self.last_search_call = 0
-        self.last_details_call = 0
+        # Rate limiting: one token bucket per call type, refilled at 1/DELAY per second
+        self.rate_limiters = {
+            'search': TokenBucket(self.RATE_LIMIT_BURST, 1 / self.SEARCH_API_DELAY),
+            'details': TokenBucket(self.RATE_LIMIT_BURST, 1 / self.DETAILS_API_DELAY),
+            'scrape': TokenBucket(self.RATE_LIMIT_BURST, 1 / self.EMAIL_SCRAPE_DELAY),
+        }
         self.total_api_calls = 0
+        self._api_calls_lock = threading.Lock()
         
         self.session = requests.Session()
+        # Size the connection pool so concurrent requests reuse connections
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.MAX_CONCURRENT_REQUESTS)
+        self.session.mount('https://', adapter)
+        # requests already advertises gzip/deflate (and br when a brotli
+        # decoder is installed); Google APIs only compress responses for user
+        # agents that mention gzip, so tag ours accordingly
+        self.session.headers['User-Agent'] = f"{requests.utils.default_user_agent()} (gzip)"
         # Set up headers for the new API
         self.session.headers.update({
             'Content-Type': 'application/json',
             'X-Goog-Api-Key': self.api_key,
-            'X-Goog-FieldMask': 'places.id,places.displayName,places.formattedAddress,places.location,places.rating,places.businessStatus,places.types,places.priceLevel,places.userRatingCount'
+            'X-Goog-FieldMask': 'places.id,places.displayName,places.formattedAddress,places.location,places.rating,places.businessStatus,places.types,places.priceLevel,places.userRatingCount,nextPageToken'
+        })
+        
+        # Separate session for web scraping with browser-like headers, shared
+        # by all scrapes so connections to each website host are reused
+        self.scrape_session = requests.Session()
+        scrape_adapter = HTTPAdapter(
+            pool_connections=self.SCRAPE_POOL_HOSTS,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(total=1, backoff_factor=0.2)
+        )
+        self.scrape_session.mount('http://', scrape_adapter)
+        self.scrape_session.mount('https://', scrape_adapter)
+        self.scrape_session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
     
     def extract_email_from_website(self, website_url: str) -> str:
@@ -81,35 +379,33 @@ class DonationFinderNew:
         if not website_url or not website_url.startswith(('http://', 'https://')):
             return ''
         
+        if not self._is_scrapable_website(website_url):
+            return ''
+        
         try:
-            # Create a separate session for web scraping with different headers
-            scrape_session = requests.Session()
-            scrape_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            # Set a short timeout to avoid long waits, and stream the body so
+            # only the first MAX_SCRAPE_BYTES are downloaded
+            content = bytearray()
+            with self.scrape_session.get(website_url, timeout=5, stream=True) as response:
+                response.raise_for_status()
+                # Check the headers before reading any of the body: PDFs,
+                # images and other downloads are dropped unread
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and 'html' not in content_type and not content_type.startswith('text/'):
+                    return ''
+                for chunk in response.iter_content(chunk_size=16384):
+                    content += chunk
+                    if len(content) >= self.MAX_SCRAPE_BYTES:
+                        break
             
-            # Set a short timeout to avoid long waits
-            response = scrape_session.get(website_url, timeout=5)
-            response.raise_for_status()
-            
-            # Look for email patterns in the HTML content
-            content = response.text.lower()
-            
-            # Common email patterns for organizations
-            email_patterns = [
-                r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-                r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',
-            ]
-            
-            for pattern in email_patterns:
-                matches = re.findall(pattern, content)
-                if matches:
-                    # Return the first valid email found
-                    email = matches[0] if isinstance(matches[0], str) else matches[0]
+            # Scan the raw bytes: no decoded/lowercased copy of the page is
+            # made, and mailto: links are checked before the broad pattern
+            for pattern in (self._MAILTO_RE, self._EMAIL_RE):
+                for match in pattern.finditer(content):
+                    email = match.group(match.lastindex or 0)
                     # Filter out common non-contact emails
-                    excluded_emails = ['noreply@', 'no-reply@', 'donotreply@', 'support@google', 'webmaster@', 'admin@', 'postmaster@']
-                    if not any(excluded in email.lower() for excluded in excluded_emails):
-                        return email
+                    if not self._EXCLUDED_EMAIL_RE.search(email):
+                        return email.lower().decode('ascii')
             
             return ''
             
@@ -119,36 +415,39 @@ class DonationFinderNew:
         except Exception:
             return ''
     
+    def _is_scrapable_website(self, website_url: str) -> bool:
+        """Return False for URLs that cannot contain a contact email worth scraping"""
+        parts = urlsplit(website_url)
+        path = parts.path.lower()
+        if path.endswith('.pdf'):
+            return False
+        
+        # Map links such as google.com/maps/...; other Google-hosted pages
+        # (sites.google.com etc.) are real organization websites
+        labels = (parts.hostname or '').split('.')
+        if 'google' in labels and (path == '/maps' or path.startswith('/maps/')):
+            return False
+        
+        # Match the host and every parent domain against the blocklist
+        return not any('.'.join(labels[i:]) in self._UNSCRAPABLE_DOMAINS for i in range(len(labels) - 1))
+    
     def _enforce_rate_limit(self, api_type: str = 'search'):
         """
-        Enforce rate limiting for API calls
+        Enforce rate limiting for API calls (thread-safe)
         
         Args:
             api_type: Type of API call ('search' or 'details')
         """
-        current_time = time.time()
+        bucket = self.rate_limiters.get(api_type)
+        if bucket:
+            waited = bucket.acquire()
+            if waited:
+                log.debug("  ⏱️  Rate limiting: waited %.1fs before %s API call", waited, api_type)
         
-        if api_type == 'search':
-            time_since_last = current_time - self.last_search_call
-            required_delay = self.SEARCH_API_DELAY
-            if time_since_last < required_delay:
-                sleep_time = required_delay - time_since_last
-                print(f"  ⏱️  Rate limiting: waiting {sleep_time:.1f}s before search API call")
-                time.sleep(sleep_time)
-            self.last_search_call = time.time()
-            
-        elif api_type == 'details':
-            time_since_last = current_time - self.last_details_call
-            required_delay = self.DETAILS_API_DELAY
-            if time_since_last < required_delay:
-                sleep_time = required_delay - time_since_last
-                print(f"  ⏱️  Rate limiting: waiting {sleep_time:.1f}s before details API call")
-                time.sleep(sleep_time)
-            self.last_details_call = time.time()
-        
-        self.total_api_calls += 1
-        if self.total_api_calls % 10 == 0:
-            print(f"  📊 Total API calls made: {self.total_api_calls}")
+        with self._api_calls_lock:
+            self.total_api_calls += 1
+            if self.total_api_calls % 10 == 0:
+                log.debug("  📊 Total API calls made: %d", self.total_api_calls)
     
     def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -161,37 +460,23 @@ class DonationFinderNew:
         Returns:
             Distance in meters
         """
-        # Convert latitude and longitude from degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Radius of earth in meters
-        r = 6371000
-        return c * r
+        return haversine_distances(lat1, lon1, [(lat2, lon2)])[0]
     
-    def search_places(self, latitude: float, longitude: float, radius: int, keyword: str, min_rating: float = 0.0) -> List[Dict[str, Any]]:
+    def _fetch_search_page(self, latitude: float, longitude: float, radius: int, keyword: str, page_token: Optional[str] = None):
         """
-        Search for places using Google Places API (New)
+        Fetch one page of Text Search results
         
-        Args:
-            latitude: Latitude of search center
-            longitude: Longitude of search center
-            radius: Search radius in meters
-            keyword: Keyword to search for
-            min_rating: Minimum rating filter
-            
         Returns:
-            List of places found
+            Tuple of (raw places on this page, token for the next page or None)
         """
-        places = []
-        
-        print(f"Searching for '{keyword}' within {radius}m of {latitude},{longitude}...")
-        
+        cache_key = (round(latitude, 4), round(longitude, 4), radius, keyword, page_token)
+        return self._search_cache.get_or_compute(
+            cache_key,
+            lambda: self._request_search_page(latitude, longitude, radius, keyword, page_token)
+        )
+    
+    def _request_search_page(self, latitude: float, longitude: float, radius: int, keyword: str, page_token: Optional[str] = None):
+        """Send one Text Search request (uncached); see _fetch_search_page"""
         # Enforce rate limiting before making the API call
         self._enforce_rate_limit('search')
         
@@ -209,41 +494,197 @@ class DonationFinderNew:
             },
             "maxResultCount": 20
         }
+        if page_token:
+            request_body["pageToken"] = page_token
         
-        try:
-            response = self.session.post(self.BASE_URL, json=request_body)
-            response.raise_for_status()
-            data = response.json()
-            
-            results = data.get('places', [])
+        response = self.session.post(self.BASE_URL, json=request_body)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        
+        return data.get('places', []), data.get('nextPageToken')
+    
+    def _filter_places(self, results: List[Dict[str, Any]], latitude: float, longitude: float, radius: int, min_rating: float, precise: bool = False) -> List[Dict[str, Any]]:
+        """
+        Keep places within radius of the search center and at or above min_rating
+        
+        Radii up to APPROXIMATE_RADIUS_LIMIT are checked with the cheaper
+        equirectangular approximation unless precise is True.
+        """
+        # Apply the cheap rating filter first so distances are only computed
+        # for places that could still be kept
+        candidates = []
+        points = []
+        for place in results:
+            location = place.get('location', {})
+            lat, lng = location.get('latitude'), location.get('longitude')
+            if lat and lng and place.get('rating', 0) >= min_rating:
+                candidates.append(place)
+                points.append((lat, lng))
+        
+        # Filter by distance manually to ensure accuracy
+        if precise or radius > self.APPROXIMATE_RADIUS_LIMIT:
+            distances = haversine_distances(latitude, longitude, points)
+        else:
+            distances = equirectangular_distances(latitude, longitude, points)
+        return [place for place, distance in zip(candidates, distances) if distance <= radius]
+    
+    def iter_places(self, latitude: float, longitude: float, radius: int, keyword: str, min_rating: float = 0.0, max_pages: int = 1, precise: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over search results across result pages
+        
+        A background thread fetches page K+1 while the caller consumes
+        page K. Page tokens are sequential, so at most one request is in
+        flight and at most one page is buffered.
+        
+        Args:
+            latitude: Latitude of search center
+            longitude: Longitude of search center
+            radius: Search radius in meters
+            keyword: Keyword to search for
+            min_rating: Minimum rating filter
+            max_pages: Maximum pages to fetch, up to MAX_SEARCH_PAGES (default: 1)
+            precise: Use the Haversine formula for the radius filter at any radius
             
-            # Filter by distance manually to ensure accuracy
-            filtered_results = []
-            for place in results:
-                location = place.get('location', {})
-                if location.get('latitude') and location.get('longitude'):
-                    distance = self.calculate_distance(
-                        latitude, longitude,
-                        location['latitude'], location['longitude']
+        Yields:
+            Places found, filtered by distance and rating
+        """
+        pages = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def fetch_pages():
+            page_token = None
+            try:
+                for _ in range(max_pages):
+                    results, page_token = self._fetch_search_page(
+                        latitude, longitude, radius, keyword, page_token
                     )
-                    if distance <= radius:
-                        # Filter by minimum rating if specified
-                        rating = place.get('rating', 0)
-                        if rating >= min_rating:
-                            filtered_results.append(place)
+                    if not put(results) or not page_token:
+                        break
+            except requests.exceptions.RequestException as e:
+                log.warning("Request error for keyword '%s': %s", keyword, e)
+            except json.JSONDecodeError as e:
+                log.warning("JSON decode error for keyword '%s': %s", keyword, e)
+            except Exception as e:
+                log.warning("Unexpected error for keyword '%s': %s", keyword, e)
+            finally:
+                put(None)
+        
+        threading.Thread(target=fetch_pages, daemon=True).start()
+        
+        try:
+            while True:
+                results = pages.get()
+                if results is None:
+                    break
+                yield from self._filter_places(results, latitude, longitude, radius, min_rating, precise)
+        finally:
+            # Unblock the fetcher if the caller stopped early
+            stop.set()
+    
+    def search_places(self, latitude: float, longitude: float, radius: int, keyword: str, min_rating: float = 0.0, max_pages: int = 1, precise: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search for places using Google Places API (New)
+        
+        Args:
+            latitude: Latitude of search center
+            longitude: Longitude of search center
+            radius: Search radius in meters
+            keyword: Keyword to search for
+            min_rating: Minimum rating filter
+            max_pages: Maximum result pages to fetch, up to MAX_SEARCH_PAGES (default: 1)
+            precise: Use the Haversine formula for the radius filter at any radius
             
-            places.extend(filtered_results)
-                    
-        except requests.exceptions.RequestException as e:
-            print(f"Request error for keyword '{keyword}': {e}")
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error for keyword '{keyword}': {e}")
-        except Exception as e:
-            print(f"Unexpected error for keyword '{keyword}': {e}")
+        Returns:
+            List of places found
+        """
+        log.info("Searching for '%s' within %dm of %s,%s...", keyword, radius, latitude, longitude)
         
-        print(f"Found {len(places)} places for keyword '{keyword}'")
+        places = list(self.iter_places(latitude, longitude, radius, keyword, min_rating, max_pages, precise))
+        
+        log.info("Found %d places for keyword '%s'", len(places), keyword)
         return places
     
+    def search_keywords(self, latitude: float, longitude: float, radius: int, keywords: List[str], min_rating: float = 0.0, max_pages: int = 1, precise: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search for several keywords concurrently and deduplicate the results
+        
+        The searches share the session's connection pool and still pass
+        through the rate limiter; only the network waits overlap. Each
+        keyword is paginated through iter_places; results are merged in
+        keyword order, so the output does not depend on which search
+        finishes first.
+        
+        Args:
+            latitude: Latitude of search center
+            longitude: Longitude of search center
+            radius: Search radius in meters
+            keywords: Keywords to search for
+            min_rating: Minimum rating filter
+            max_pages: Maximum pages per keyword, up to MAX_SEARCH_PAGES (default: 1)
+            precise: Use the Haversine formula for the radius filter at any radius
+            
+        Returns:
+            Unique raw places found for all keywords, in keyword order
+        """
+        if not keywords:
+            return []
+        
+        def search(keyword):
+            log.info("Searching for '%s' within %dm of %s,%s...", keyword, radius, latitude, longitude)
+            places = list(self.iter_places(latitude, longitude, radius, keyword, min_rating, max_pages, precise))
+            log.info("Found %d places for keyword '%s'", len(places), keyword)
+            return places
+        
+        workers = min(len(keywords), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(search, keywords))
+        
+        seen_ids = set()
+        unique_places = []
+        for places in results:
+            for place in places:
+                place_id = place.get('id')
+                if place_id:
+                    if place_id in seen_ids:
+                        continue
+                    seen_ids.add(place_id)
+                unique_places.append(place)
+        
+        return unique_places
+    
+    def _fetch_place_details(self, place_id: str, field_mask: str) -> Dict[str, Any]:
+        """
+        Fetch raw Place Details data for the given field mask, using the details cache
+        
+        Raises:
+            requests.exceptions.RequestException, json.JSONDecodeError on failure
+        """
+        def request_details():
+            headers = {
+                'Content-Type': 'application/json',
+                'X-Goog-Api-Key': self.api_key,
+                'X-Goog-FieldMask': field_mask
+            }
+            url = self.PLACE_DETAILS_URL.format(place_id=place_id)
+            
+            # Enforce rate limiting before making the API call
+            self._enforce_rate_limit('details')
+            
+            response = self.session.get(url, headers=headers)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        
+        return self._details_cache.get_or_compute((field_mask, place_id), request_details)
+    
     def get_place_details_with_reviews(self, place_id: str, max_reviews: int = 5) -> Dict[str, Any]:
         """
         Get detailed information about a place including user reviews
@@ -256,24 +697,11 @@ class DonationFinderNew:
             Dictionary containing place details and reviews
         """
         # Define what fields we want to get (including email if available)
-        field_mask = "id,displayName,formattedAddress,rating,userRatingCount,reviews,photos,regularOpeningHours,internationalPhoneNumber,websiteUri,businessStatus,editorialSummary"
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Goog-Api-Key': self.api_key,
-            'X-Goog-FieldMask': field_mask
-        }
-        
-        url = self.PLACE_DETAILS_URL.format(place_id=place_id)
-        
-        # Enforce rate limiting before making the API call
-        self._enforce_rate_limit('details')
+        field_mask = "id,displayName,formattedAddress,rating,userRatingCount,reviews,regularOpeningHours.weekdayDescriptions,internationalPhoneNumber,websiteUri,businessStatus"
         
         try:
-            print(f"Fetching details for place: {place_id}")
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
-            place_data = response.json()
+            log.debug("Fetching details for place: %s", place_id)
+            place_data = self._fetch_place_details(place_id, field_mask)
             
             # Process reviews if available
             reviews = []
@@ -311,76 +739,70 @@ class DonationFinderNew:
                 'website': place_data.get('websiteUri', ''),
                 'email': '',  # Email extraction moved to separate method
                 'business_status': place_data.get('businessStatus', 'UNKNOWN'),
-                'photos_available': len(place_data.get('photos', [])),
                 'review_count': len(reviews)
             }
             
         except requests.exceptions.RequestException as e:
-            print(f"Request error fetching place details: {e}")
+            log.warning("Request error fetching place details: %s", e)
             return {'error': f"Request error: {e}"}
         except json.JSONDecodeError as e:
-            print(f"JSON decode error fetching place details: {e}")
+            log.warning("JSON decode error fetching place details: %s", e)
             return {'error': f"JSON decode error: {e}"}
         except Exception as e:
-            print(f"Unexpected error fetching place details: {e}")
+            log.warning("Unexpected error fetching place details: %s", e)
             return {'error': f"Unexpected error: {e}"}
     
     def enhance_places_with_emails(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Enhance places list with email addresses extracted from their websites
         
+        Places are processed concurrently (up to MAX_CONCURRENT_REQUESTS at
+        a time) and only once per place id; the returned list keeps the
+        input order.
+        
         Args:
             places: List of places from search results
             
         Returns:
             Enhanced list of places with email addresses
         """
-        enhanced_places = []
+        log.info("\n📧 Extracting email addresses for %d places...", len(places))
         
-        print(f"\n📧 Extracting email addresses for {len(places)} places...")
+        enhanced_places = self._map_concurrent(
+            self._enhance_place_with_email,
+            places
+        )
         
-        for i, place in enumerate(places):
-            print(f"Processing {i+1}/{len(places)}: {place.get('name', 'Unknown')}")
-            
-            place_id = place.get('id') or place.get('place_id')
-            if not place_id:
-                print(f"  No place_id found for {place.get('name', 'Unknown')}")
-                enhanced_place = place.copy()
-                enhanced_place['email'] = ''
-                enhanced_place['website'] = ''
-                enhanced_place['phone'] = ''
-                enhanced_places.append(enhanced_place)
-                continue
-            
-            # Get basic place details for website URL
-            details = self._get_basic_place_details(place_id)
-            
-            if 'error' in details:
-                print(f"  Error fetching details: {details['error']}")
-                enhanced_place = place.copy()
-                enhanced_place['email'] = ''
-                enhanced_place['website'] = ''
-                enhanced_place['phone'] = ''
-                enhanced_places.append(enhanced_place)
-                continue
-            
-            # Merge original place data with contact information
-            enhanced_place = place.copy()
-            enhanced_place.update({
-                'email': details.get('email', ''),
-                'website': details.get('website', ''),
-                'phone': details.get('phone', ''),
-                'business_status': details.get('business_status', 'UNKNOWN'),
-                'email_extracted': True
-            })
-            
-            email_status = "✅ Found" if details.get('email') else "❌ Not found"
-            print(f"  📧 Email: {email_status}")
-            enhanced_places.append(enhanced_place)
-        
-        print(f"📧 Email extraction completed for {len(enhanced_places)} places")
+        log.info("📧 Email extraction completed for %d places", len(enhanced_places))
         return enhanced_places
     
+    def _enhance_place_with_email(self, i: int, total: int, place: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch contact details and website email for a single place, returning the fields to add"""
+        log.debug("Processing %d/%d: %s", i + 1, total, place.get('name', 'Unknown'))
+        
+        place_id = place.get('id') or place.get('place_id')
+        if not place_id:
+            log.debug("  No place_id found for %s", place.get('name', 'Unknown'))
+            return {'email': '', 'website': '', 'phone': ''}
+        
+        # Get basic place details for website URL
+        details = self._get_basic_place_details(place_id)
+        
+        if 'error' in details:
+            log.debug("  Error fetching details: %s", details['error'])
+            return {'email': '', 'website': '', 'phone': ''}
+        
+        log.debug("  📧 Email: %s", "✅ Found" if details.get('email') else "❌ Not found")
+        
+        # Contact information to merge onto the original place data
+        return {
+            'email': details.get('email', ''),
+            'website': details.get('website', ''),
+            'phone': details.get('phone', ''),
+            'business_status': details.get('business_status', 'UNKNOWN'),
+            'email_extracted': True
+        }
+    
     def _get_basic_place_details(self, place_id: str) -> Dict[str, Any]:
         """
         Get basic place details including website and phone for email extraction
@@ -394,37 +816,26 @@ class DonationFinderNew:
         # Define minimal fields we need for email extraction
         field_mask = "id,displayName,formattedAddress,internationalPhoneNumber,websiteUri,businessStatus"
         
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Goog-Api-Key': self.api_key,
-            'X-Goog-FieldMask': field_mask
-        }
-        
-        url = self.PLACE_DETAILS_URL.format(place_id=place_id)
-        
-        # Enforce rate limiting before making the API call
-        self._enforce_rate_limit('details')
-        
         try:
-            print(f"  🔍 Fetching contact details for place: {place_id}")
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
-            place_data = response.json()
+            log.debug("  🔍 Fetching contact details for place: %s", place_id)
+            place_data = self._fetch_place_details(place_id, field_mask)
             
             # Extract website URL for email extraction
             website_url = place_data.get('websiteUri', '')
             
             # Try to extract email from website (with rate limiting)
             email = ''
-            if website_url:
-                print(f"    🌐 Checking website: {website_url}")
+            if website_url and not self._is_scrapable_website(website_url):
+                log.debug("    ⏭️  Skipping non-scrapable website: %s", website_url)
+            elif website_url:
+                # Pace scraping to be respectful to websites
+                self.rate_limiters['scrape'].acquire()
+                log.debug("    🌐 Checking website: %s", website_url)
                 email = self.extract_email_from_website(website_url)
                 if email:
-                    print(f"    ✅ Found email: {email}")
+                    log.debug("    ✅ Found email: %s", email)
                 else:
-                    print(f"    ❌ No email found on website")
-                # Add a delay to be respectful to websites
-                time.sleep(self.EMAIL_SCRAPE_DELAY)
+                    log.debug("    ❌ No email found on website")
             
             return {
                 'place_id': place_data.get('id', place_id),
@@ -436,19 +847,23 @@ class DonationFinderNew:
             }
             
         except requests.exceptions.RequestException as e:
-            print(f"  Request error fetching place details: {e}")
+            log.warning("  Request error fetching place details: %s", e)
             return {'error': f"Request error: {e}"}
         except json.JSONDecodeError as e:
-            print(f"  JSON decode error fetching place details: {e}")
+            log.warning("  JSON decode error fetching place details: %s", e)
             return {'error': f"JSON decode error: {e}"}
         except Exception as e:
-            print(f"  Unexpected error fetching place details: {e}")
+            log.warning("  Unexpected error fetching place details: %s", e)
             return {'error': f"Unexpected error: {e}"}
     
     def enhance_places_with_reviews(self, places: List[Dict[str, Any]], max_reviews: int = 3, include_all: bool = False) -> List[Dict[str, Any]]:
         """
         Enhance places list with detailed reviews and additional information
         
+        Places are processed concurrently (up to MAX_CONCURRENT_REQUESTS at
+        a time) and only once per place id; the returned list keeps the
+        input order.
+        
         Args:
             places: List of places from search results
             max_reviews: Maximum reviews per place (default: 3)
@@ -457,64 +872,90 @@ class DonationFinderNew:
         Returns:
             Enhanced list of places with reviews
         """
-        enhanced_places = []
+        log.info("\n📝 Fetching detailed reviews for places...")
         
-        print(f"\n📝 Fetching detailed reviews for places...")
+        enhanced_places = self._map_concurrent(
+            lambda i, total, place: self._enhance_place_with_reviews(i, total, place, max_reviews, include_all),
+            places
+        )
         
-        for i, place in enumerate(places):
-            print(f"Processing {i+1}/{len(places)}: {place.get('name', 'Unknown')}")
-            
-            # Skip getting reviews for low-rated places unless include_all is True
-            rating = place.get('rating', 0) or 0  # Handle None ratings
-            if not include_all and rating < 3.0:
-                print(f"  Skipping reviews for low-rated place (rating: {rating})")
-                enhanced_place = place.copy()
-                enhanced_place['reviews'] = []
-                enhanced_place['detailed_info_fetched'] = False
-                enhanced_places.append(enhanced_place)
-                continue
-            
-            place_id = place.get('id') or place.get('place_id')
-            if not place_id:
-                print(f"  No place_id found for {place.get('name', 'Unknown')}")
-                enhanced_place = place.copy()
-                enhanced_place['reviews'] = []
-                enhanced_place['detailed_info_fetched'] = False
-                enhanced_places.append(enhanced_place)
-                continue
-            
-            # Get detailed information including reviews
-            details = self.get_place_details_with_reviews(place_id, max_reviews)
-            
-            if 'error' in details:
-                print(f"  Error fetching details: {details['error']}")
-                enhanced_place = place.copy()
-                enhanced_place['reviews'] = []
-                enhanced_place['detailed_info_fetched'] = False
-                enhanced_places.append(enhanced_place)
-                continue
-            
-            # Merge original place data with detailed information
+        log.info("📝 Enhanced %d places with detailed information", len(enhanced_places))
+        return enhanced_places
+    
+    def _enhance_place_with_reviews(self, i: int, total: int, place: Dict[str, Any], max_reviews: int, include_all: bool) -> Dict[str, Any]:
+        """Fetch details and reviews for a single place, returning the fields to add"""
+        log.debug("Processing %d/%d: %s", i + 1, total, place.get('name', 'Unknown'))
+        
+        # Skip getting reviews for low-rated places unless include_all is True
+        rating = place.get('rating', 0) or 0  # Handle None ratings
+        if not include_all and rating < 3.0:
+            log.debug("  Skipping reviews for low-rated place (rating: %s)", rating)
+            return {'reviews': [], 'detailed_info_fetched': False}
+        
+        place_id = place.get('id') or place.get('place_id')
+        if not place_id:
+            log.debug("  No place_id found for %s", place.get('name', 'Unknown'))
+            return {'reviews': [], 'detailed_info_fetched': False}
+        
+        # Get detailed information including reviews
+        details = self.get_place_details_with_reviews(place_id, max_reviews)
+        
+        if 'error' in details:
+            log.debug("  Error fetching details: %s", details['error'])
+            return {'reviews': [], 'detailed_info_fetched': False}
+        
+        log.debug("  ✅ Added %d reviews", len(details.get('reviews', [])))
+        
+        # Detailed information to merge onto the original place data
+        return {
+            'reviews': details.get('reviews', []),
+            'opening_hours': details.get('opening_hours', []),
+            'phone': details.get('phone', ''),
+            'website': details.get('website', ''),
+            'email': details.get('email', ''),
+            'business_status': details.get('business_status', 'UNKNOWN'),
+            'review_count': details.get('review_count', 0),
+            'user_ratings_total': details.get('user_ratings_total', 0),
+            'detailed_info_fetched': True
+        }
+    
+    def _map_concurrent(self, func, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enhance places concurrently on a bounded thread pool, preserving order
+        
+        func(index, total, place) returns the fields to add to a place; each
+        result is merged onto a copy of the place. func runs once per place
+        id; later places with the same id (e.g. one place matched by several
+        keywords) reuse the first result instead of repeating its details
+        requests and website scrape, and keep their own remaining fields.
+        """
+        if not places:
+            return []
+        
+        # Map every input position to the slot of its first occurrence
+        first_slot = {}
+        unique_places = []
+        slots = []
+        for place in places:
+            place_id = _place_id(place)
+            slot = first_slot.setdefault(place_id, len(unique_places)) if place_id else len(unique_places)
+            if slot == len(unique_places):
+                unique_places.append(place)
+            slots.append(slot)
+        
+        total = len(unique_places)
+        workers = min(total, self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            added_fields = list(executor.map(func, range(total), [total] * total, unique_places))
+        
+        if total < len(places):
+            log.info("  ♻️  Reused results for %d duplicate places", len(places) - total)
+        
+        enhanced_places = []
+        for place, slot in zip(places, slots):
             enhanced_place = place.copy()
-            enhanced_place.update({
-                'reviews': details.get('reviews', []),
-                'opening_hours': details.get('opening_hours', []),
-                'phone': details.get('phone', ''),
-                'website': details.get('website', ''),
-                'email': details.get('email', ''),
-                'business_status': details.get('business_status', 'UNKNOWN'),
-                'photos_available': details.get('photos_available', 0),
-                'review_count': details.get('review_count', 0),
-                'user_ratings_total': details.get('user_ratings_total', 0),
-                'detailed_info_fetched': True
-            })
-            
-            print(f"  ✅ Added {len(details.get('reviews', []))} reviews")
+            enhanced_place.update(added_fields[slot])
             enhanced_places.append(enhanced_place)
-            
-            # Rate limiting is now handled by _enforce_rate_limit method
-        
-        print(f"📝 Enhanced {len(enhanced_places)} places with detailed information")
         return enhanced_places
     
     def process_places(self, places: List[Dict[str, Any]], origin_lat: float, origin_lng: float) -> List[Dict[str, Any]]:
@@ -528,36 +969,45 @@ class DonationFinderNew:
         Returns:
             Processed and formatted places data
         """
+        # Parse each API dict once; everything below reads attributes
+        raw_places = [RawPlace.from_api(place) for place in places]
+        
+        # Calculate distances from origin for all located places in one batch
+        distances = iter(haversine_distances(
+            origin_lat, origin_lng,
+            [(raw.latitude, raw.longitude) for raw in raw_places if raw.located]
+        ))
+        
+        # Build rows in one pass; each raw status string is mapped through
+        # a small cache
+        closed_status = 'BUSINESS_STATUS_PERMANENTLY_CLOSED'
+        status_names = {}
         processed_places = []
+        append = processed_places.append
         
-        for place in places:
-            location = place.get('location', {})
+        for raw in raw_places:
+            distance = next(distances) if raw.located else 0
             
-            # Calculate distance from origin
-            distance = 0
-            if location.get('latitude') and location.get('longitude'):
-                distance = self.calculate_distance(
-                    origin_lat, origin_lng,
-                    location['latitude'], location['longitude']
-                )
+            status = raw.business_status
+            status_name = status_names.get(status)
+            if status_name is None:
+                status_name = status_names[status] = status.replace('BUSINESS_STATUS_', '')
             
-            processed_place = {
-                'name': place.get('displayName', {}).get('text', 'Unknown'),
-                'address': place.get('formattedAddress', 'No address available'),
-                'place_id': place.get('id', ''),
-                'latitude': location.get('latitude'),
-                'longitude': location.get('longitude'),
-                'rating': place.get('rating'),
-                'business_status': place.get('businessStatus', '').replace('BUSINESS_STATUS_', ''),
-                'types': place.get('types', []),
-                'price_level': place.get('priceLevel'),
-                'user_ratings_total': place.get('userRatingCount'),
+            append({
+                'name': raw.name,
+                'address': raw.address,
+                'place_id': raw.id,
+                'latitude': raw.latitude,
+                'longitude': raw.longitude,
+                'rating': raw.rating,
+                'business_status': status_name,
+                'types': raw.types,
+                'price_level': raw.price_level,
+                'user_ratings_total': raw.user_ratings_total,
                 'distance_meters': round(distance, 2),
                 'distance_km': round(distance / 1000, 2),
-                'permanently_closed': place.get('businessStatus') == 'BUSINESS_STATUS_PERMANENTLY_CLOSED'
-            }
-            
-            processed_places.append(processed_place)
+                'permanently_closed': status == closed_status
+            })
         
         return processed_places
     
@@ -585,13 +1035,20 @@ class DonationFinderNew:
         
         return unique_places
     
+    @classmethod
+    def pages_for_results(cls, max_results: int) -> int:
+        """Return the result pages per keyword needed to fill max_results places"""
+        return min(max(1, math.ceil(max_results / cls.SEARCH_PAGE_SIZE)), cls.MAX_SEARCH_PAGES)
+    
     def find_donation_opportunities(self, 
                                   latitude: float, 
                                   longitude: float,
                                   radius: int = 5000,
                                   keywords: Optional[List[str]] = None,
                                   min_rating: float = 0.0,
-                                  sort_by_distance: bool = True) -> List[Dict[str, Any]]:
+                                  sort_by_distance: bool = True,
+                                  max_pages: int = 1,
+                                  precise: bool = False) -> List[Dict[str, Any]]:
         """
         Find donation opportunities near the specified location
         
@@ -602,6 +1059,8 @@ class DonationFinderNew:
             keywords: List of keywords to search for (default: DEFAULT_KEYWORDS)
             min_rating: Minimum rating filter (default: 0.0, no filter)
             sort_by_distance: Sort results by distance (default: True)
+            max_pages: Result pages per keyword, up to 20 places each (default: 1)
+            precise: Use the Haversine formula for the radius filter at any radius (default: False)
             
         Returns:
             List of donation opportunities
@@ -609,33 +1068,28 @@ class DonationFinderNew:
         if keywords is None:
             keywords = self.DEFAULT_KEYWORDS
         
-        all_places = []
+        log.info("Searching for donation opportunities near %s,%s", latitude, longitude)
+        log.info("Radius: %dm, Min Rating: %s", radius, min_rating)
+        log.info("Keywords: %s", ', '.join(keywords))
+        log.info("-" * 60)
         
-        print(f"Searching for donation opportunities near {latitude},{longitude}")
-        print(f"Radius: {radius}m, Min Rating: {min_rating}")
-        print(f"Keywords: {', '.join(keywords)}")
-        print("-" * 60)
+        # Search all keywords concurrently (rate limiting still applies); results
+        # come back deduplicated by place id, so nothing below is done twice
+        all_places = self.search_keywords(latitude, longitude, radius, keywords, min_rating, max_pages, precise)
         
-        # Search for each keyword
-        for keyword in keywords:
-            places = self.search_places(latitude, longitude, radius, keyword, min_rating)
-            all_places.extend(places)
-            
-            # Rate limiting is now handled by _enforce_rate_limit method
-        
-        print("-" * 60)
-        print(f"Total places found: {len(all_places)}")
+        log.info("-" * 60)
+        log.info("Total places found: %d", len(all_places))
         
         # Process places
         processed_places = self.process_places(all_places, latitude, longitude)
         
         # Remove duplicates
         unique_places = self.deduplicate_places(processed_places)
-        print(f"Unique places after deduplication: {len(unique_places)}")
+        log.info("Unique places after deduplication: %d", len(unique_places))
         
         # Filter out permanently closed places
         active_places = [place for place in unique_places if not place.get('permanently_closed', False)]
-        print(f"Active places (not permanently closed): {len(active_places)}")
+        log.info("Active places (not permanently closed): %d", len(active_places))
         
         # Sort by distance if requested
         if sort_by_distance:
@@ -647,13 +1101,26 @@ class DonationFinderNew:
         """
         Save results to JSON file
         
+        Places are encoded and written one record at a time, so only one
+        serialized place is held in memory. Filenames ending in .gz are
+        written gzip-compressed.
+        
         Args:
             places: List of places to save
             filename: Output filename (default: donation_opportunities.json)
         """
+        opener = gzip.open if filename.endswith('.gz') else open
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(places, f, indent=2, ensure_ascii=False)
-            print(f"\nResults saved to {filename}")
+            with opener(filename, 'wb') as f:
+                # Same layout as json.dump(places, f, indent=2): each record
+                # is indented one extra level inside the list
+                f.write(b'[')
+                separator = b'\n  '
+                for place in places:
+                    f.write(separator)
+                    f.write(_json_dumps_indented(place).replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+                f.write(b'\n]' if places else b']')
+            log.info("\nResults saved to %s", filename)
         except Exception as e:
-            print(f"Error saving to JSON: {e}")
\ No newline at end of file
+            log.error("Error saving to JSON: %s", e)
\ No newline at end of file
@@ -9,23 +9,242 @@ using Gmail API v1.
 import json
 import os
 import base64
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from functools import lru_cache
+from email.header import Header
+from email.utils import formataddr, getaddresses
+from html import escape
+from string import Template
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
+    from google_auth_httplib2 import AuthorizedHttp
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from googleapiclient.http import build_http
     GMAIL_API_AVAILABLE = True
 except ImportError:
     GMAIL_API_AVAILABLE = False
 
 
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Report templates, compiled once at import. string.Template placeholders
+# ($name) leave the CSS braces alone and ignore "$" inside substituted values.
+_HTML_HEADER_TEMPLATE = Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .header { background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+                .place { background-color: #ffffff; border: 1px solid #ddd; border-radius: 8px; padding: 15px; margin-bottom: 15px; }
+                .place-name { color: #2c3e50; font-size: 18px; font-weight: bold; margin-bottom: 8px; }
+                .place-info { color: #666; margin: 5px 0; }
+                .rating { color: #f39c12; font-weight: bold; }
+                .address { color: #7f8c8d; }
+                .email { color: #27ae60; font-weight: bold; }
+                .phone { color: #3498db; }
+                .reviews { margin-top: 10px; padding-top: 10px; border-top: 1px solid #eee; }
+                .review { margin: 10px 0; padding: 8px; background-color: #f8f9fa; border-radius: 4px; }
+                .review-author { font-weight: bold; color: #2c3e50; }
+                .review-rating { color: #f39c12; }
+                .footer { margin-top: 30px; padding-top: 20px; border-top: 2px solid #eee; color: #7f8c8d; font-size: 12px; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h2>🎯 Donation Opportunities Found</h2>
+                <p><strong>Search Details:</strong></p>
+                <ul>
+                    <li><strong>Search Type:</strong> $search_type</li>
+                    <li><strong>Location:</strong> $location</li>
+                    <li><strong>Keywords:</strong> $keywords</li>
+                    <li><strong>Results Found:</strong> $count organizations</li>
+                    <li><strong>Generated:</strong> $timestamp</li>
+                </ul>
+            </div>
+        """)
+
+_HTML_PLACE_TEMPLATE = Template("""
+            <div class="place">
+                <div class="place-name">$index. $name</div>
+                <div class="place-info rating">⭐ Rating: $rating_text</div>
+                <div class="place-info address">📍 Address: $address</div>
+            """)
+
+# Star strings for whole-number ratings 0-5, indexed by int(rating)
+_STARS = tuple("⭐" * count for count in range(6))
+
+# Review blocks are filled with str.format_map over a _ReviewFields mapping
+_HTML_REVIEW_TEMPLATE = """
+                    <div class="review">
+                        <div class="review-author">{author_name} 
+                        <span class="review-rating">({rating} {stars})</span></div>
+                        <div>"{text}"</div>
+                        <div style="font-size: 11px; color: #999; margin-top: 5px;">
+                            {time_description}
+                        </div>
+                    </div>
+                    """
+
+_HTML_FOOTER = """
+            <div class="footer">
+                <p>This report was generated automatically by the Donation Opportunities Finder system.</p>
+                <p>For questions or support, please contact your system administrator.</p>
+            </div>
+        </body>
+        </html>
+        """
+
+_TEXT_HEADER_TEMPLATE = Template("""DONATION OPPORTUNITIES FOUND
+Generated: $timestamp
+
+SEARCH DETAILS:
+- Search Type: $search_type
+- Location: $location
+- Keywords: $keywords
+- Results Found: $count organizations
+
+RESULTS:
+""" + "=" * 60 + """
+
+""")
+
+_TEXT_PLACE_TEMPLATE = Template("""$index. $name
+   Rating: $rating_text
+   Address: $address""")
+
+_TEXT_REVIEW_TEMPLATE = """
+     • {author_name} ({rating} {stars}):
+       "{excerpt}"
+       ({time_description})"""
+
+_TEXT_FOOTER = """
+
+This report was generated automatically by the Donation Opportunities Finder system.
+For questions or support, please contact your system administrator.
+"""
+
+
+class _ReviewFields(dict):
+    """Review dict for str.format_map that fills in display defaults for missing fields"""
+    
+    DEFAULTS = {
+        'author_name': 'Anonymous',
+        'rating': 'N/A',
+        'text': 'No review text',
+        'time_description': 'Unknown date'
+    }
+    
+    def __missing__(self, key):
+        return self.DEFAULTS[key]
+
+
+class _HtmlReviewFields(_ReviewFields):
+    """_ReviewFields that HTML-escapes every value as it is formatted"""
+    
+    def __getitem__(self, key):
+        return escape(str(super().__getitem__(key)))
+
+
+@dataclass
+class ReportPlace:
+    """Fields of one place shown in a results report, read from the place dict once"""
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        'name', 'address', 'rating', 'phone', 'email', 'website',
+        'distance_miles', 'reviews'
+    )
+    
+    name: Any
+    address: Any
+    rating: Optional[float]
+    phone: Optional[str]
+    email: Optional[str]
+    website: Optional[str]
+    distance_miles: Optional[float]
+    reviews: Optional[List[Dict[str, Any]]]
+    
+    @classmethod
+    def from_dict(cls, place):
+        """Parse a place dict as returned by DonationFinderNew"""
+        get = place.get
+        return cls(
+            name=get('name', 'Unknown Name'),
+            address=get('address', 'Address not available'),
+            rating=get('rating'),
+            phone=get('phone'),
+            email=get('email'),
+            website=get('website'),
+            distance_miles=get('distance_miles'),
+            reviews=get('reviews')
+        )
+
+
+def _report_places(places):
+    """Return places as ReportPlace records, parsing any that are still dicts"""
+    return [place if isinstance(place, ReportPlace) else ReportPlace.from_dict(place) for place in places]
+
+
+# Gmail credentials shared by every EmailSender in the process
+_creds_cache = None
+
+
+@lru_cache(maxsize=1)
+def _read_token_credentials(path, mtime, scopes):
+    """Parse a token file once per modification time"""
+    return Credentials.from_authorized_user_file(path, list(scopes))
+
+
+@lru_cache(maxsize=1)
+def _auth_files_present():
+    """
+    Return (credentials.json exists, token.json exists) from one directory scan
+    
+    The result is cached; call _auth_files_present.cache_clear() after
+    writing either file.
+    """
+    found = set()
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name in ('credentials.json', 'token.json') and entry.is_file():
+                found.add(entry.name)
+    return 'credentials.json' in found, 'token.json' in found
+
+
+def _encode_header(value):
+    """Return a header value on one line, RFC 2047-encoded if it is not ASCII"""
+    value = ' '.join(str(value).splitlines())
+    if value.isascii():
+        return value
+    return Header(value, 'utf-8').encode()
+
+
+def _encode_address_header(value):
+    """Return an address header with any non-ASCII display names encoded"""
+    value = ' '.join(str(value).splitlines())
+    if value.isascii():
+        return value
+    return ', '.join(formataddr(address, charset='utf-8') for address in getaddresses([value]))
+
+
 class EmailSender:
     """Email sender for donation opportunities results using Gmail API"""
     
@@ -35,17 +254,31 @@ class EmailSender:
         'https://www.googleapis.com/auth/gmail.readonly'
     ]
     
+    # Attachment read size: 57 raw bytes encode to one 76-character base64 line
+    ATTACHMENT_BLOCK_SIZE = 57 * 1024
+    
+    # Retries for sends rejected as rate limited (429) or failed server-side
+    # (5xx), with exponential backoff and jitter between attempts
+    SEND_NUM_RETRIES = 5
+    
+    # Background sends run one at a time: a sender's HTTP connection is
+    # not safe to share between threads
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='email-send')
+    
     def __init__(self, config_path='config.json'):
         """Initialize email sender with configuration"""
         self.config = self._load_config(config_path)
         self.email_config = self.config.get('email_settings', {})
         self.service = None
+        self._creds = None
+        self._http = None
         
     def _load_config(self, config_path):
         """Load configuration from file"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            return _json_loads(data)
         except FileNotFoundError:
             return {}
         except json.JSONDecodeError:
@@ -53,15 +286,30 @@ class EmailSender:
             return {}
     
     def _get_gmail_service(self):
-        """Authenticate and get Gmail API service"""
+        """
+        Authenticate and get Gmail API service
+        
+        The service is built once per sender and reused for later emails
+        while its credentials stay valid.
+        """
         if not GMAIL_API_AVAILABLE:
             raise ImportError("Gmail API dependencies not installed. Run: pip install google-auth google-auth-oauthlib google-api-python-client")
         
-        creds = None
+        global _creds_cache
         
-        # Load existing credentials
-        if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', self.SCOPES)
+        if self.service is not None and self._creds is not None and self._creds.valid:
+            return self.service
+        
+        # Reuse credentials another sender already loaded; otherwise load
+        # token.json, which is only re-parsed after it changes on disk
+        creds = _creds_cache
+        if not creds or not creds.valid:
+            try:
+                mtime = os.stat('token.json').st_mtime_ns
+            except FileNotFoundError:
+                creds = None
+            else:
+                creds = _read_token_credentials('token.json', mtime, tuple(self.SCOPES))
         
         # If there are no (valid) credentials available, let the user log in.
         if not creds or not creds.valid:
@@ -89,52 +337,135 @@ class EmailSender:
             # Save the credentials for the next run
             with open('token.json', 'w') as token:
                 token.write(creds.to_json())
+            _auth_files_present.cache_clear()
+        
+        _creds_cache = creds
+        
+        # One HTTP client per sender: rebuilding the service after a token
+        # refresh keeps its open connection to the Gmail API. build_http()
+        # applies the client library's default timeout and redirect handling.
+        if self._http is None:
+            self._http = build_http()
         
-        return build('gmail', 'v1', credentials=creds)
+        # The Gmail discovery document ships with google-api-python-client;
+        # use it instead of downloading (and file-caching) it on each build
+        self._creds = creds
+        self.service = build(
+            'gmail', 'v1',
+            http=AuthorizedHttp(creds, http=self._http),
+            cache_discovery=False,
+            static_discovery=True
+        )
+        return self.service
     
     def _create_message(self, sender, to, subject, message_content, attachments=None):
-        """Create a message for an email"""
-        message = MIMEMultipart('alternative')
-        message['to'] = to
-        message['from'] = sender
-        message['subject'] = subject
+        """
+        Create a message for an email
         
+        The MIME document is assembled directly as bytes, skipping the email
+        package's object model and generator. A lone body is sent as a single
+        text part, text and HTML bodies as multipart/alternative, and a
+        multipart/mixed wrapper is only added when there are attachments.
+        """
         # Add message body (both text and HTML versions)
         if isinstance(message_content, dict):
-            if 'text' in message_content:
-                text_part = MIMEText(message_content['text'], 'plain', 'utf-8')
-                message.attach(text_part)
-            if 'html' in message_content:
-                html_part = MIMEText(message_content['html'], 'html', 'utf-8')
-                message.attach(html_part)
+            bodies = [
+                (message_content[key], subtype)
+                for key, subtype in (('text', 'plain'), ('html', 'html'))
+                if key in message_content
+            ]
         else:
-            text_part = MIMEText(str(message_content), 'plain', 'utf-8')
-            message.attach(text_part)
+            bodies = [(str(message_content), 'plain')]
+        
+        headers, payload = self._body_entity(bodies)
         
         # Add attachments
-        if attachments:
-            for file_path in attachments:
-                if os.path.exists(file_path):
-                    with open(file_path, 'rb') as attachment:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(attachment.read())
-                    
-                    encoders.encode_base64(part)
-                    filename = os.path.basename(file_path)
-                    part.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename= {filename}',
-                    )
-                    message.attach(part)
+        attachment_paths = [path for path in attachments or () if os.path.exists(path)]
+        if attachment_paths:
+            boundary = self._new_boundary()
+            mixed = [f"--{boundary}\n{headers}\n".encode('ascii')]
+            mixed.extend(payload)
+            
+            for file_path in attachment_paths:
+                filename = os.path.basename(file_path)
+                mixed.append((
+                    f'--{boundary}\n'
+                    'Content-Type: application/octet-stream\n'
+                    'MIME-Version: 1.0\n'
+                    'Content-Transfer-Encoding: base64\n'
+                    f'Content-Disposition: attachment; filename= {_encode_header(filename)}\n'
+                    '\n'
+                ).encode('ascii'))
+                
+                # Encode the file a block at a time; blocks are a multiple
+                # of 57 bytes, so each encodes to whole 76-character lines
+                with open(file_path, 'rb') as attachment:
+                    for block in iter(lambda: attachment.read(self.ATTACHMENT_BLOCK_SIZE), b''):
+                        mixed.append(base64.encodebytes(block))
+            
+            mixed.append(f"--{boundary}--\n".encode('ascii'))
+            headers = (
+                f'Content-Type: multipart/mixed; boundary="{boundary}"\n'
+                'MIME-Version: 1.0\n'
+            )
+            payload = mixed
+        
+        parts = [(
+            f'{headers}'
+            f'to: {_encode_address_header(to)}\n'
+            f'from: {_encode_address_header(sender)}\n'
+            f'subject: {_encode_header(subject)}\n'
+            '\n'
+        ).encode('ascii')]
+        parts.extend(payload)
         
         # Encode the message
-        raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+        raw_message = base64.urlsafe_b64encode(b''.join(parts)).decode('utf-8')
         return {'raw': raw_message}
     
+    def _new_boundary(self):
+        """Return a random MIME boundary string"""
+        return f"==============={secrets.token_hex(16)}=="
+    
+    def _body_entity(self, bodies):
+        """
+        Build the MIME entity for the message bodies
+        
+        Args:
+            bodies: List of (content, subtype) pairs, e.g. ('...', 'html')
+            
+        Returns:
+            Tuple of (header text, list of payload byte chunks)
+        """
+        if len(bodies) == 1:
+            content, subtype = bodies[0]
+            headers = (
+                f'Content-Type: text/{subtype}; charset="utf-8"\n'
+                'MIME-Version: 1.0\n'
+                'Content-Transfer-Encoding: base64\n'
+            )
+            return headers, [base64.encodebytes(content.encode('utf-8'))]
+        
+        boundary = self._new_boundary()
+        payload = []
+        for body in bodies:
+            part_headers, part_payload = self._body_entity([body])
+            payload.append(f"--{boundary}\n{part_headers}\n".encode('ascii'))
+            payload.extend(part_payload)
+        payload.append(f"--{boundary}--\n".encode('ascii'))
+        
+        headers = (
+            f'Content-Type: multipart/alternative; boundary="{boundary}"\n'
+            'MIME-Version: 1.0\n'
+        )
+        return headers, payload
+    
     def _send_message(self, service, user_id, message):
         """Send an email message"""
         try:
-            message = service.users().messages().send(userId=user_id, body=message).execute()
+            # The client library retries 429/5xx responses with randomized
+            # exponential backoff
+            message = service.users().messages().send(userId=user_id, body=message).execute(num_retries=self.SEND_NUM_RETRIES)
             return message
         except HttpError as error:
             print(f'An error occurred: {error}')
@@ -144,154 +475,109 @@ class EmailSender:
         """Create an HTML email report"""
         timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
         
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-                .place {{ background-color: #ffffff; border: 1px solid #ddd; border-radius: 8px; padding: 15px; margin-bottom: 15px; }}
-                .place-name {{ color: #2c3e50; font-size: 18px; font-weight: bold; margin-bottom: 8px; }}
-                .place-info {{ color: #666; margin: 5px 0; }}
-                .rating {{ color: #f39c12; font-weight: bold; }}
-                .address {{ color: #7f8c8d; }}
-                .email {{ color: #27ae60; font-weight: bold; }}
-                .phone {{ color: #3498db; }}
-                .reviews {{ margin-top: 10px; padding-top: 10px; border-top: 1px solid #eee; }}
-                .review {{ margin: 10px 0; padding: 8px; background-color: #f8f9fa; border-radius: 4px; }}
-                .review-author {{ font-weight: bold; color: #2c3e50; }}
-                .review-rating {{ color: #f39c12; }}
-                .footer {{ margin-top: 30px; padding-top: 20px; border-top: 2px solid #eee; color: #7f8c8d; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h2>🎯 Donation Opportunities Found</h2>
-                <p><strong>Search Details:</strong></p>
-                <ul>
-                    <li><strong>Search Type:</strong> {search_info.get('type', 'Unknown')}</li>
-                    <li><strong>Location:</strong> {search_info.get('location', 'Unknown')}</li>
-                    <li><strong>Keywords:</strong> {search_info.get('keywords', 'N/A')}</li>
-                    <li><strong>Results Found:</strong> {len(places)} organizations</li>
-                    <li><strong>Generated:</strong> {timestamp}</li>
-                </ul>
-            </div>
-        """
+        # Search details and place data come from user input and third-party
+        # listings, so every such value is HTML-escaped before insertion
+        parts = [_HTML_HEADER_TEMPLATE.substitute(
+            search_type=escape(str(search_info.get('type', 'Unknown'))),
+            location=escape(str(search_info.get('location', 'Unknown'))),
+            keywords=escape(str(search_info.get('keywords', 'N/A'))),
+            count=len(places),
+            timestamp=timestamp
+        )]
         
-        for i, place in enumerate(places, 1):
-            rating_value = place.get('rating') or 0
-            rating_stars = "⭐" * int(rating_value) if rating_value else ""
-            rating_text = f"{place.get('rating', 'N/A')} {rating_stars}" if place.get('rating') else "No rating"
+        for i, place in enumerate(_report_places(places), 1):
+            rating = place.rating
+            rating_text = f"{rating} {_STARS[int(rating)]}" if rating else "No rating"
             
-            html += f"""
-            <div class="place">
-                <div class="place-name">{i}. {place.get('name', 'Unknown Name')}</div>
-                <div class="place-info rating">⭐ Rating: {rating_text}</div>
-                <div class="place-info address">📍 Address: {place.get('address', 'Address not available')}</div>
-            """
+            parts.append(_HTML_PLACE_TEMPLATE.substitute(
+                index=i,
+                name=escape(str(place.name)),
+                rating_text=escape(rating_text),
+                address=escape(str(place.address))
+            ))
             
-            if place.get('phone'):
-                html += f'<div class="place-info phone">📞 Phone: {place.get("phone")}</div>'
+            if place.phone:
+                parts.append(f'<div class="place-info phone">📞 Phone: {escape(str(place.phone))}</div>')
             
-            if place.get('email'):
-                html += f'<div class="place-info email">📧 Email: {place.get("email")}</div>'
+            if place.email:
+                parts.append(f'<div class="place-info email">📧 Email: {escape(str(place.email))}</div>')
             
-            if place.get('website'):
-                html += f'<div class="place-info">🌐 Website: <a href="{place.get("website")}">{place.get("website")}</a></div>'
+            if place.website:
+                website = escape(str(place.website))
+                parts.append(f'<div class="place-info">🌐 Website: <a href="{website}">{website}</a></div>')
             
-            if place.get('distance_miles'):
-                html += f'<div class="place-info">📏 Distance: {place.get("distance_miles"):.1f} miles</div>'
+            if place.distance_miles:
+                parts.append(f'<div class="place-info">📏 Distance: {place.distance_miles:.1f} miles</div>')
             
             # Add reviews if available
-            if place.get('reviews'):
-                html += '<div class="reviews"><strong>Recent Reviews:</strong>'
-                for review in place.get('reviews')[:3]:  # Show first 3 reviews
-                    review_rating = review.get('rating') or 0
-                    review_stars = "⭐" * int(review_rating) if review_rating else ""
-                    html += f"""
-                    <div class="review">
-                        <div class="review-author">{review.get('author_name', 'Anonymous')} 
-                        <span class="review-rating">({review.get('rating', 'N/A')} {review_stars})</span></div>
-                        <div>"{review.get('text', 'No review text')}"</div>
-                        <div style="font-size: 11px; color: #999; margin-top: 5px;">
-                            {review.get('time_description', 'Unknown date')}
-                        </div>
-                    </div>
-                    """
-                html += '</div>'
+            if place.reviews:
+                parts.append('<div class="reviews"><strong>Recent Reviews:</strong>')
+                parts.extend(
+                    _HTML_REVIEW_TEMPLATE.format_map(
+                        _HtmlReviewFields(review, stars=_STARS[int(review.get('rating') or 0)])
+                    )
+                    for review in place.reviews[:3]  # Show first 3 reviews
+                )
+                parts.append('</div>')
             
-            html += '</div>'
+            parts.append('</div>')
         
-        html += f"""
-            <div class="footer">
-                <p>This report was generated automatically by the Donation Opportunities Finder system.</p>
-                <p>For questions or support, please contact your system administrator.</p>
-            </div>
-        </body>
-        </html>
-        """
+        parts.append(_HTML_FOOTER)
         
-        return html
+        return ''.join(parts)
     
     def _create_text_report(self, places, search_info):
         """Create a plain text email report"""
         timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
         
-        text = f"""DONATION OPPORTUNITIES FOUND
-Generated: {timestamp}
-
-SEARCH DETAILS:
-- Search Type: {search_info.get('type', 'Unknown')}
-- Location: {search_info.get('location', 'Unknown')}
-- Keywords: {search_info.get('keywords', 'N/A')}
-- Results Found: {len(places)} organizations
-
-RESULTS:
-{'='*60}
-
-"""
+        parts = [_TEXT_HEADER_TEMPLATE.substitute(
+            timestamp=timestamp,
+            search_type=search_info.get('type', 'Unknown'),
+            location=search_info.get('location', 'Unknown'),
+            keywords=search_info.get('keywords', 'N/A'),
+            count=len(places)
+        )]
         
-        for i, place in enumerate(places, 1):
-            rating_value = place.get('rating') or 0
-            rating_stars = "⭐" * int(rating_value) if rating_value else ""
-            rating_text = f"{place.get('rating', 'N/A')} {rating_stars}" if place.get('rating') else "No rating"
+        for i, place in enumerate(_report_places(places), 1):
+            rating = place.rating
+            rating_text = f"{rating} {_STARS[int(rating)]}" if rating else "No rating"
             
-            text += f"""{i}. {place.get('name', 'Unknown Name')}
-   Rating: {rating_text}
-   Address: {place.get('address', 'Address not available')}"""
+            parts.append(_TEXT_PLACE_TEMPLATE.substitute(
+                index=i,
+                name=place.name,
+                rating_text=rating_text,
+                address=place.address
+            ))
             
-            if place.get('phone'):
-                text += f"\n   Phone: {place.get('phone')}"
+            if place.phone:
+                parts.append(f"\n   Phone: {place.phone}")
             
-            if place.get('email'):
-                text += f"\n   Email: {place.get('email')}"
+            if place.email:
+                parts.append(f"\n   Email: {place.email}")
             
-            if place.get('website'):
-                text += f"\n   Website: {place.get('website')}"
+            if place.website:
+                parts.append(f"\n   Website: {place.website}")
             
-            if place.get('distance_miles'):
-                text += f"\n   Distance: {place.get('distance_miles'):.1f} miles"
+            if place.distance_miles:
+                parts.append(f"\n   Distance: {place.distance_miles:.1f} miles")
             
             # Add reviews if available
-            if place.get('reviews'):
-                text += f"\n   Reviews ({len(place.get('reviews'))} total):"
-                for review in place.get('reviews')[:2]:  # Show first 2 reviews for text
-                    review_rating = review.get('rating') or 0
-                    review_stars = "⭐" * int(review_rating) if review_rating else ""
-                    text += f"""
-     • {review.get('author_name', 'Anonymous')} ({review.get('rating', 'N/A')} {review_stars}):
-       "{review.get('text', 'No review text')[:100]}{'...' if len(review.get('text', '')) > 100 else ''}"
-       ({review.get('time_description', 'Unknown date')})"""
+            if place.reviews:
+                parts.append(f"\n   Reviews ({len(place.reviews)} total):")
+                parts.extend(
+                    _TEXT_REVIEW_TEMPLATE.format_map(_ReviewFields(
+                        review,
+                        stars=_STARS[int(review.get('rating') or 0)],
+                        excerpt=review.get('text', 'No review text')[:100] + ('...' if len(review.get('text', '')) > 100 else '')
+                    ))
+                    for review in place.reviews[:2]  # Show first 2 reviews for text
+                )
             
-            text += f"\n{'-'*60}\n"
+            parts.append(f"\n{'-'*60}\n")
         
-        text += """
-
-This report was generated automatically by the Donation Opportunities Finder system.
-For questions or support, please contact your system administrator.
-"""
+        parts.append(_TEXT_FOOTER)
         
-        return text
+        return ''.join(parts)
     
     def send_results_email(self, places, search_info, attach_files=None):
         """Send email with donation opportunities results using Gmail API"""
@@ -305,46 +591,51 @@ For questions or support, please contact your system administrator.
             return False
         
         try:
-            # Get Gmail service
+            # Authenticate in the background while the reports are built;
+            # token refresh and service setup are network-bound
             print("📧 Authenticating with Gmail API...")
-            service = self._get_gmail_service()
-            
-            # Use the email from config or a default
-            sender_email = self.email_config.get('sender_email', 'cliqueadmin@helpables.org')
-            
-            # Create subject with search info
-            subject_template = self.email_config.get('subject_template', 'Donation Opportunities Found - {search_type}')
-            subject = subject_template.format(
-                search_type=search_info.get('type', 'Search Results'),
-                location=search_info.get('location', ''),
-                count=len(places)
-            )
-            
-            # Create both HTML and text versions
-            text_content = self._create_text_report(places, search_info)
-            html_content = self._create_html_report(places, search_info)
-            
-            message_content = {
-                'text': text_content,
-                'html': html_content
-            }
-            
-            # Create message
-            sender_name = self.email_config.get('sender', 'Donation Finder System')
-            sender_formatted = f"{sender_name} <{sender_email}>"
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                service_future = executor.submit(self._get_gmail_service)
+                
+                # Use the email from config or a default
+                sender_email = self.email_config.get('sender_email', 'cliqueadmin@helpables.org')
+                
+                # Create subject with search info
+                subject_template = self.email_config.get('subject_template', 'Donation Opportunities Found - {search_type}')
+                subject = subject_template.format(
+                    search_type=search_info.get('type', 'Search Results'),
+                    location=search_info.get('location', ''),
+                    count=len(places)
+                )
+                
+                # Create both HTML and text versions from places parsed once
+                report_places = _report_places(places)
+                text_content = self._create_text_report(report_places, search_info)
+                html_content = self._create_html_report(report_places, search_info)
+                
+                message_content = {
+                    'text': text_content,
+                    'html': html_content
+                }
+                
+                # Create message
+                sender_name = self.email_config.get('sender', 'Donation Finder System')
+                sender_formatted = f"{sender_name} <{sender_email}>"
+                
+                message = self._create_message(
+                    sender_formatted, 
+                    recipient, 
+                    subject, 
+                    message_content,
+                    attach_files
+                )
+                
+                service = service_future.result()
             
             print(f"📧 Sending email to {recipient}...")
             print(f"   From: {sender_formatted}")
             print(f"   Subject: {subject}")
             
-            message = self._create_message(
-                sender_formatted, 
-                recipient, 
-                subject, 
-                message_content,
-                attach_files
-            )
-            
             # Send the message
             result = self._send_message(service, 'me', message)
             
@@ -381,6 +672,15 @@ For questions or support, please contact your system administrator.
             print("   Please check your Gmail API configuration")
             return False
     
+    def send_results_email_async(self, places, search_info, attach_files=None):
+        """
+        Send a results email in the background
+        
+        Returns:
+            Future resolving to the send_results_email() result
+        """
+        return self._executor.submit(self.send_results_email, places, search_info, attach_files)
+    
     def is_configured(self):
         """Check if email is properly configured"""
         if not self.email_config.get('enabled', True):
@@ -393,22 +693,24 @@ For questions or support, please contact your system administrator.
             return False
         
         # Check if credentials.json exists or if already authenticated
-        return os.path.exists('credentials.json') or os.path.exists('token.json')
+        return any(_auth_files_present())
 
 
 def test_email_configuration():
     """Test email configuration"""
     sender = EmailSender()
+    credentials_found, token_found = _auth_files_present()
+    configured = sender.is_configured()
     
     print("📧 Gmail API Email Configuration Test")
     print(f"   Gmail API Available: {'✅ Yes' if GMAIL_API_AVAILABLE else '❌ No'}")
     print(f"   Enabled: {sender.email_config.get('enabled', 'Not set')}")
     print(f"   Recipient: {sender.email_config.get('recipient', 'Not set')}")
-    print(f"   Credentials File: {'✅ Found' if os.path.exists('credentials.json') else '❌ Missing'}")
-    print(f"   Token File: {'✅ Found' if os.path.exists('token.json') else '❌ Not authenticated yet'}")
-    print(f"   Overall Status: {'✅ Ready' if sender.is_configured() else '❌ Not ready'}")
+    print(f"   Credentials File: {'✅ Found' if credentials_found else '❌ Missing'}")
+    print(f"   Token File: {'✅ Found' if token_found else '❌ Not authenticated yet'}")
+    print(f"   Overall Status: {'✅ Ready' if configured else '❌ Not ready'}")
     
-    if not sender.is_configured():
+    if not configured:
         print("\n📝 Gmail API Setup Steps:")
         print("   1. Install dependencies: pip install google-auth google-auth-oauthlib google-api-python-client")
         print("   2. Go to Google Cloud Console (console.cloud.google.com)")
@@ -6,11 +6,41 @@ This version uses a pre-built coordinate mapping for common zip codes
 to perform more accurate location-based searches.
 """
 
-import json
 import os
-from donation_finder import DonationFinderNew
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from donation_finder import DonationFinderNew, _json_loads
+
+
+# One compact record per ZIP code instead of a dict per entry
+ZipLocation = namedtuple('ZipLocation', ['lat', 'lng', 'city', 'state'])
+
+
+@lru_cache(maxsize=1)
+def _read_zip_coordinates(path):
+    """Parse a zip coordinates file once per process; finders share the result"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    entries = _json_loads(data)
+    
+    # City and state names repeat across many ZIP codes; intern them so
+    # each distinct name is stored once
+    return {
+        zip_code: ZipLocation(
+            info['lat'], info['lng'],
+            sys.intern(info.get('city', '')), sys.intern(info.get('state', ''))
+        )
+        for zip_code, info in entries.items()
+    }
+
 
 class SimpleZipCodeFinder:
+    # Maximum number of ZIP codes searched at once; all searches share
+    # one DonationFinderNew, so its rate limits still apply globally
+    MAX_CONCURRENT_ZIPS = 4
+    
     def __init__(self, api_key):
         self.finder = DonationFinderNew(api_key)
         self.zip_coordinates = self._load_zip_coordinates()
@@ -18,8 +48,7 @@ class SimpleZipCodeFinder:
     def _load_zip_coordinates(self):
         """Load zip code to coordinate mapping"""
         try:
-            with open('zip_coordinates.json', 'r') as f:
-                return json.load(f)
+            return _read_zip_coordinates('zip_coordinates.json')
         except FileNotFoundError:
             print("Warning: zip_coordinates.json not found. Using fallback method.")
             return {}
@@ -32,11 +61,12 @@ class SimpleZipCodeFinder:
         print(f"Searching for donation opportunities in zip code: {zip_code}")
         print(f"Keywords: {', '.join(keywords)}")
         
+        # Only fetch the result pages max_results can actually use
+        max_pages = self.finder.pages_for_results(max_results)
+        
         # Check if we have coordinates for this zip code
         if zip_code in self.zip_coordinates:
-            zip_info = self.zip_coordinates[zip_code]
-            lat, lng = zip_info['lat'], zip_info['lng']
-            city, state = zip_info.get('city', ''), zip_info.get('state', '')
+            lat, lng, city, state = self.zip_coordinates[zip_code]
             
             print(f"Using coordinates for {zip_code} ({city}, {state}): {lat}, {lng}")
             
@@ -47,7 +77,8 @@ class SimpleZipCodeFinder:
                 radius=radius,
                 keywords=keywords,
                 min_rating=0.0,
-                sort_by_distance=True
+                sort_by_distance=True,
+                max_pages=max_pages
             )
             
             return places[:max_results]
@@ -71,7 +102,8 @@ class SimpleZipCodeFinder:
                 radius=radius * 2,  # Larger radius for text search
                 keywords=enhanced_keywords[:6],  # Limit to prevent too many API calls
                 min_rating=0.0,
-                sort_by_distance=False
+                sort_by_distance=False,
+                max_pages=max_pages
             )
             
             return places[:max_results]
@@ -79,20 +111,50 @@ class SimpleZipCodeFinder:
         return []
     
     def search_by_zip_batch(self, zip_codes, keywords, max_results_per_zip=10, radius=5000):
-        """Search multiple zip codes in batch"""
+        """
+        Search multiple zip codes in batch, running the searches concurrently
+        
+        Repeated ZIP codes, and ZIP codes with identical center coordinates,
+        share a single search; every requested ZIP code still gets its own
+        entry in the results.
+        """
         all_results = {}
+        if not zip_codes:
+            return all_results
         
-        for zip_code in zip_codes:
-            print(f"\n{'='*50}")
-            print(f"Processing zip code: {zip_code}")
-            print(f"{'='*50}")
-            
-            results = self.search_by_zip(zip_code, keywords, max_results_per_zip, radius)
-            all_results[zip_code] = results
-            
-            if results:
-                print(f"Found {len(results)} donation opportunities in {zip_code}")
+        # Map each distinct ZIP code to the one actually searched for its
+        # center. Only exact matches share: distances, sorting and the radius
+        # filter are all relative to the searched center.
+        searched_for = {}
+        centers = {}
+        for zip_code in dict.fromkeys(zip_codes):
+            location = self.zip_coordinates.get(zip_code)
+            if location is None:
+                searched_for[zip_code] = zip_code
             else:
-                print(f"No donation opportunities found in {zip_code}")
+                center = (location.lat, location.lng)
+                searched_for[zip_code] = centers.setdefault(center, zip_code)
+        search_zips = list(dict.fromkeys(searched_for.values()))
+        
+        workers = min(len(search_zips), self.MAX_CONCURRENT_ZIPS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                zip_code: executor.submit(self.search_by_zip, zip_code, keywords, max_results_per_zip, radius)
+                for zip_code in search_zips
+            }
+            
+            for zip_code, search_zip in searched_for.items():
+                results = list(futures[search_zip].result())
+                all_results[zip_code] = results
+                
+                print(f"\n{'='*50}")
+                print(f"Processed zip code: {zip_code}")
+                if search_zip != zip_code:
+                    print(f"Shared search with {search_zip} (same location)")
+                print(f"{'='*50}")
+                if results:
+                    print(f"Found {len(results)} donation opportunities in {zip_code}")
+                else:
+                    print(f"No donation opportunities found in {zip_code}")
         
         return all_results
\ No newline at end of file